@@ -9,15 +9,33 @@ about using a Google App Password.
 **GitHub Actions Compatible**
 -----------------------------
 Timeouts and visibility checks adjusted to support Playwright in CI.
+
+**HTTP-first scraping**
+-----------------------
+Polls go through ``httpx`` + BeautifulSoup first; Chromium is only
+launched when the plain-HTTP path fails (or ``FORCE_PLAYWRIGHT`` is set).
+
+**Scheduling**
+--------------
+``python monitor_status.py`` runs a single check and exits, so nothing
+stays resident between polls — drive it from cron (``*/30 * * * *``), a
+systemd timer, or the GitHub Actions schedule in
+``.github/workflows/main.yml``. ``python monitor_status.py loop`` keeps
+the old in-process scheduler for hosts without one.
 """
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
+import hashlib
 import os
+import re
 import smtplib
 import ssl
 import sys
-import unittest
+import time
+from contextlib import asynccontextmanager
 from email.message import EmailMessage
 from pathlib import Path
 from typing import Final, Optional
@@ -27,16 +45,26 @@ from dotenv import load_dotenv
 STATUS_FILE: Final[Path] = Path("latest_status.txt")
 CHECK_TIMEOUT_MS: Final[int] = int(os.getenv("CHECK_TIMEOUT_MS", "60000"))
 COOKIE_WAIT_MS: Final[int] = 8000
+POLL_INTERVAL_S: Final[int] = int(os.getenv("POLL_INTERVAL_S", "1800"))
+STATUS_TTL_S: Final[int] = int(os.getenv("STATUS_TTL_S", "1800"))
+STATE_FILE: Final[Path] = Path("emirates_state.json")
+STATE_MAX_AGE_S: Final[int] = 12 * 3600
+APPLICATIONS_URL: Final[str] = (
+    "https://external.emiratesgroupcareers.com/en_US/careersmarketplace/"
+    "ProfileJobApplications"
+)
+FORCE_PLAYWRIGHT: Final[bool] = bool(os.getenv("FORCE_PLAYWRIGHT"))
+BLOCKED_RESOURCE_TYPES: Final[frozenset] = frozenset(
+    {"image", "media", "font", "stylesheet", "other"}
+)
 
-load_dotenv()
-
-USERNAME = os.getenv("EMIRATES_USER")
-PASSWORD = os.getenv("EMIRATES_PASS")
-EMAIL_FROM = os.getenv("EMAIL_FROM")
-EMAIL_TO = os.getenv("EMAIL_TO")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
-SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
+REQUIRED_KEYS: Final[tuple[str, ...]] = (
+    "EMIRATES_USER",
+    "EMIRATES_PASS",
+    "EMAIL_FROM",
+    "EMAIL_TO",
+    "EMAIL_PASSWORD",
+)
 
 APPLICATION_TAB = (
     "#main-panel > section > div.section__header.section__header--tabs > "
@@ -50,16 +78,19 @@ COOKIE_ACCEPT = "#onetrust-accept-btn-handler"
 LOGIN_BUTTON_ID = "#login"
 
 
-def _require(var: Optional[str], name: str) -> str:
-    if not var:
-        raise RuntimeError(f"Environment variable {name} is required but missing.")
-    return var
-
-USERNAME = _require(USERNAME, "EMIRATES_USER")
-PASSWORD = _require(PASSWORD, "EMIRATES_PASS")
-EMAIL_FROM = _require(EMAIL_FROM, "EMAIL_FROM")
-EMAIL_TO = _require(EMAIL_TO, "EMAIL_TO")
-EMAIL_PASSWORD = _require(EMAIL_PASSWORD, "EMAIL_PASSWORD")
+@functools.lru_cache(maxsize=1)
+def _env() -> dict[str, str]:
+    """Parse ``.env`` and validate required keys exactly once per process."""
+    load_dotenv()
+    out: dict[str, str] = {}
+    for key in REQUIRED_KEYS:
+        value = os.getenv(key)
+        if not value:
+            raise RuntimeError(f"Environment variable {key} is required but missing.")
+        out[key] = value
+    out["SMTP_SERVER"] = os.getenv("SMTP_SERVER", "smtp.gmail.com")
+    out["SMTP_PORT"] = os.getenv("SMTP_PORT", "465")
+    return out
 
 
 def _async_playwright():
@@ -72,43 +103,201 @@ def _async_playwright():
         ) from exc
 
 
+def _httpx():
+    try:
+        import httpx  # type: ignore
+        return httpx
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "httpx not installed. Run 'pip install httpx[http2]'."
+        ) from exc
+
+
+def _beautifulsoup():
+    try:
+        from bs4 import BeautifulSoup  # type: ignore
+        return BeautifulSoup
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "BeautifulSoup not installed. Run 'pip install beautifulsoup4'."
+        ) from exc
+
+
+# The status file holds three lines — write timestamp, SHA-256 digest,
+# raw status — so the unchanged-check is a 64-char string compare that
+# never needs the (potentially growing) status body.
+
+def _digest(s: str) -> str:
+    return hashlib.sha256(s.encode()).hexdigest()
+
 def read_last_status(path: Path = STATUS_FILE) -> str:
-    return path.read_text().strip() if path.exists() else ""
+    if not path.exists():
+        return ""
+    lines = path.read_text().split("\n", 2)
+    # Legacy files hold just the raw status on one line.
+    return lines[2].strip() if len(lines) == 3 else lines[0].strip()
+
+def read_last_digest(path: Path = STATUS_FILE) -> str:
+    if not path.exists():
+        return ""
+    lines = path.read_text().split("\n", 2)
+    return lines[1] if len(lines) == 3 else _digest(lines[0].strip())
+
+def read_last_write_ts(path: Path = STATUS_FILE) -> float:
+    """Timestamp of the last real fetch, 0.0 for missing/legacy files."""
+    if not path.exists():
+        return 0.0
+    lines = path.read_text().split("\n", 2)
+    if len(lines) == 3:
+        try:
+            return float(lines[0])
+        except ValueError:
+            pass
+    return 0.0
+
+def _refresh_status_ts(path: Path = STATUS_FILE) -> None:
+    status = read_last_status(path)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(f"{time.time():.0f}\n{_digest(status)}\n{status}")
+    os.replace(tmp, path)
 
 def write_last_status(status: str, path: Path = STATUS_FILE) -> None:
-    path.write_text(status)
+    if _digest(status) == read_last_digest(path):
+        return
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(f"{time.time():.0f}\n{_digest(status)}\n{status}")
+    os.replace(tmp, path)
 
 
 from smtplib import SMTPAuthenticationError
 
 def _compose_email(new_status: str) -> EmailMessage:
+    env = _env()
     msg = EmailMessage()
     msg["Subject"] = "Emirates application status updated"
-    msg["From"] = EMAIL_FROM
-    msg["To"] = EMAIL_TO
+    msg["From"] = env["EMAIL_FROM"]
+    msg["To"] = env["EMAIL_TO"]
     msg.set_content(f"Your application status changed to: {new_status}")
     return msg
 
-def _send_email(new_status: str) -> None:
-    msg = _compose_email(new_status)
+SMTP_IDLE_MAX_S: Final[int] = 60
+
+_smtp: Optional[smtplib.SMTP] = None
+_smtp_last_use: float = 0.0
+
+def _connect_smtp() -> smtplib.SMTP:
+    env = _env()
+    server, port = env["SMTP_SERVER"], int(env["SMTP_PORT"])
     ctx = ssl.create_default_context()
+    if port == 465:
+        s = smtplib.SMTP_SSL(server, port, context=ctx)
+    else:
+        s = smtplib.SMTP(server, port)
+        s.starttls(context=ctx)
+    s.login(env["EMAIL_FROM"], env["EMAIL_PASSWORD"])
+    return s
+
+def _close_smtp() -> None:
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        _smtp = None
+
+atexit.register(_close_smtp)
+
+def _get_smtp() -> smtplib.SMTP:
+    """Return a logged-in SMTP connection, reconnecting only when needed.
+
+    The TLS + AUTH handshake dominates single-message SMTP cost, so the
+    connection is kept open between sends. Gmail drops idle sockets, so
+    anything idle longer than ``SMTP_IDLE_MAX_S`` — or that fails a
+    ``noop`` health check — is reconnected.
+    """
+    global _smtp, _smtp_last_use
+    if _smtp is not None:
+        stale = time.monotonic() - _smtp_last_use > SMTP_IDLE_MAX_S
+        if not stale:
+            try:
+                stale = _smtp.noop()[0] != 250
+            except (smtplib.SMTPException, OSError):
+                stale = True
+        if stale:
+            _close_smtp()
+    if _smtp is None:
+        _smtp = _connect_smtp()
+    _smtp_last_use = time.monotonic()
+    return _smtp
 
+def _send_email(new_status: str) -> None:
+    msg = _compose_email(new_status)
     try:
-        if SMTP_PORT == 465:
-            with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=ctx) as s:
-                s.login(EMAIL_FROM, EMAIL_PASSWORD)
-                s.send_message(msg)
-        else:
-            with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as s:
-                s.starttls(context=ctx)
-                s.login(EMAIL_FROM, EMAIL_PASSWORD)
-                s.send_message(msg)
+        _get_smtp().send_message(msg)
     except SMTPAuthenticationError as err:
         raise RuntimeError(
             "Gmail rejected your credentials. You must use a 16-char App Password."
         ) from err
 
 
+_http_client = None
+
+def _get_http_client():
+    global _http_client
+    if _http_client is None:
+        httpx = _httpx()
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=CHECK_TIMEOUT_MS / 1000,
+        )
+    return _http_client
+
+
+async def _fetch_status_http() -> str:
+    """Scrape the status cell over plain HTTP — no Chromium involved.
+
+    The module-level client keeps the session cookies, so steady-state
+    polls are a single GET. Raises on any miss (login form the POST
+    can't clear, missing markup) so the caller can fall back to the
+    Playwright path.
+    """
+    soup_cls = _beautifulsoup()
+    client = _get_http_client()
+
+    resp = await client.get(APPLICATIONS_URL)
+    resp.raise_for_status()
+    soup = soup_cls(resp.text, "html.parser")
+
+    username_input = soup.find("input", attrs={"name": "username"})
+    if username_input is not None:
+        form = username_input.find_parent("form")
+        if form is None:
+            raise RuntimeError("Login form markup not understood.")
+        action = str(resp.url.join(form.get("action") or ""))
+        fields = {
+            i.get("name"): i.get("value", "")
+            for i in form.find_all("input")
+            if i.get("name")
+        }
+        env = _env()
+        fields["username"] = env["EMIRATES_USER"]
+        fields["password"] = env["EMIRATES_PASS"]
+        resp = await client.post(action, data=fields)
+        resp.raise_for_status()
+        resp = await client.get(APPLICATIONS_URL)
+        resp.raise_for_status()
+        soup = soup_cls(resp.text, "html.parser")
+
+    cell = soup.select_one(STATUS_CELL) or soup.select_one(
+        STATUS_CELL.replace("tbody > ", "")
+    )
+    if cell is None:
+        raise RuntimeError("Status cell not present in server-rendered HTML.")
+    return cell.get_text(strip=True)
+
+
 async def _dismiss_cookies(page):
     try:
         await page.wait_for_selector(COOKIE_ACCEPT, timeout=COOKIE_WAIT_MS)
@@ -117,90 +306,211 @@ async def _dismiss_cookies(page):
     except Exception:
         pass
 
+# Trim browser-side and prefer the trailing text node so icon/aria text
+# inside the cell never reaches Python.
+_STATUS_TEXT_JS = (
+    "el => el.lastChild && el.lastChild.nodeType === 3"
+    " ? el.lastChild.nodeValue.trim()"
+    " : el.textContent.trim()"
+)
+
+_FILL_CREDENTIALS_JS = """([u, p]) => {
+    const U = document.querySelector('input[name=username]');
+    const P = document.querySelector('input[name=password]');
+    U.value = u;
+    P.value = p;
+    U.dispatchEvent(new Event('input', {bubbles: true}));
+    P.dispatchEvent(new Event('input', {bubbles: true}));
+}"""
+
+async def _fill_credentials(page) -> None:
+    env = _env()
+    user, password = env["EMIRATES_USER"], env["EMIRATES_PASS"]
+    try:
+        await page.evaluate(_FILL_CREDENTIALS_JS, [user, password])
+    except Exception:
+        # Frameworks that only react to native setter dispatch (React et
+        # al.) get the original per-field fill instead.
+        await page.fill('input[name="username"]', user)
+        await page.fill('input[name="password"]', password)
+
+
 async def _click_login(page):
-    await _dismiss_cookies(page)
-    for sel in (LOGIN_BUTTON_ID, 'button:has-text("Log in")', 'text="Log in"'):
-        if await page.locator(sel).is_visible():
-            await page.locator(sel).click(force=True)
-            return
-    raise RuntimeError("Login button not found – update selectors.")
+    from playwright.async_api import TimeoutError as PWTimeoutError  # type: ignore
+
+    login = (
+        page.locator(LOGIN_BUTTON_ID)
+        .or_(page.get_by_role("button", name=re.compile("log in", re.I)))
+        .or_(page.get_by_text("Log in", exact=True))
+    )
+    try:
+        await login.first.click(force=True, timeout=COOKIE_WAIT_MS)
+    except PWTimeoutError:
+        raise RuntimeError("Login button not found – update selectors.")
+
+
+async def _block_heavy_resources(route):
+    # Selectors match on the DOM regardless of stylesheet loading, so
+    # only document/script/xhr/fetch traffic is needed for the scrape.
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
-async def _fetch_status() -> str:
-    async_playwright = _async_playwright()
+async def _fetch_status(context) -> str:
     from playwright.async_api import TimeoutError as PWTimeoutError  # type: ignore
 
-    async with async_playwright() as p:  # type: ignore[attr-defined]
-        browser = await p.chromium.launch(headless=True)
-        page = await (await browser.new_context()).new_page()
+    await context.route("**/*", _block_heavy_resources)
+    page = await context.new_page()
+    # Short default fuse for element actions so a stuck selector fails
+    # fast; navigations keep the long CHECK_TIMEOUT_MS budget.
+    page.set_default_timeout(10_000)
+    page.set_default_navigation_timeout(CHECK_TIMEOUT_MS)
 
+    async def _goto():
         try:
-            await page.goto(
-                "https://external.emiratesgroupcareers.com/en_US/careersmarketplace/ProfileJobApplications",
-                wait_until="load",
-                timeout=CHECK_TIMEOUT_MS,
-            )
+            await page.goto(APPLICATIONS_URL, wait_until="domcontentloaded")
         except PWTimeoutError:
             print("[warn] Page load timed out.")
 
-        if await page.locator('input[name="username"]').is_visible():
-            await page.fill('input[name="username"]', USERNAME)
-            await page.fill('input[name="password"]', PASSWORD)
-            await _click_login(page)
-            try:
-                await page.wait_for_load_state("networkidle", timeout=15000)
-            except PWTimeoutError:
-                print("[warn] Login network idle wait timed out.")
+    # The cookie banner appears while the page is still loading, so the
+    # wait for it runs concurrently with the navigation instead of
+    # serially afterwards; _dismiss_cookies already swallows the case
+    # where the banner never shows.
+    await asyncio.gather(_goto(), _dismiss_cookies(page))
 
+    if await page.locator('input[name="username"]').is_visible():
+        await _fill_credentials(page)
+        await _click_login(page)
         try:
-            await page.wait_for_selector(APPLICATION_TAB, timeout=CHECK_TIMEOUT_MS)
-            await page.click(APPLICATION_TAB)
-            await page.wait_for_load_state("networkidle", timeout=10000)
+            await page.wait_for_selector(
+                APPLICATION_TAB, state="visible", timeout=15000
+            )
         except PWTimeoutError:
-            print("[warn] Applications tab not found or network idle timeout")
+            print("[warn] Applications tab not visible after login.")
+        else:
+            await context.storage_state(path=str(STATE_FILE))
 
-        try:
-            await page.wait_for_selector(STATUS_CELL, timeout=CHECK_TIMEOUT_MS)
-            text = await page.text_content(STATUS_CELL)
-        except PWTimeoutError:
-            print("[warn] Status cell not found; returning empty.")
-            text = None
-        return (text or "").strip()
+    try:
+        await page.locator(APPLICATION_TAB).click()
+    except PWTimeoutError:
+        print("[warn] Applications tab not found")
+
+    try:
+        text = await page.locator(STATUS_CELL).evaluate(_STATUS_TEXT_JS)
+    except PWTimeoutError:
+        print("[warn] Status cell not found; returning empty.")
+        text = None
+    return text or ""
+
+
+async def _new_context(browser):
+    """Create a context, reusing cached login cookies when still fresh.
+
+    The saved ``storage_state`` lets a poll land directly on the
+    applications page; ``_fetch_status`` only re-runs the login flow
+    when the username field shows up again (session expired).
+    """
+    if STATE_FILE.exists() and time.time() - STATE_FILE.stat().st_mtime < STATE_MAX_AGE_S:
+        return await browser.new_context(storage_state=str(STATE_FILE))
+    return await browser.new_context()
 
 
-async def _check_once() -> None:
-    status, last = await _fetch_status(), read_last_status()
-    if status != "Phone Screening Scheduled":
+async def _current_status(get_browser) -> str:
+    if not FORCE_PLAYWRIGHT:
+        try:
+            return await _fetch_status_http()
+        except Exception as exc:
+            print(f"[warn] HTTP scrape failed ({exc}); falling back to Playwright.")
+    browser = await get_browser()
+    context = await _new_context(browser)
+    try:
+        return await _fetch_status(context)
+    finally:
+        await context.close()
+
+
+async def _check_once(get_browser) -> None:
+    # latest_status.txt doubles as a TTL cache: its first line records
+    # when the status was last fetched, so a recent stamp means there is
+    # nothing new to learn yet and the whole fetch can be skipped. The
+    # stamp lives in the file rather than its mtime because git resets
+    # mtimes on checkout, which would mark every fresh CI clone "fresh".
+    if time.time() - read_last_write_ts() < STATUS_TTL_S / 2:
+        print("Cached status still fresh; skipping fetch.")
+        return
+
+    status = await _current_status(get_browser)
+    if not status:
+        # A failed scrape returns "" — keep the previous status and
+        # timestamp so the next run retries instead of recording a
+        # phantom change.
+        print("[warn] Fetch returned no status; keeping previous state.")
+        return
+    if _digest(status) != read_last_digest():
+        last = read_last_status()
         write_last_status(status)
-        if status:
-            _send_email(status)
-        print(f"Status changed: {last or '[none]'} → {status or '[empty]'}")
+        _send_email(status)
+        print(f"Status changed: {last or '[none]'} → {status}")
     else:
         print("No change detected.")
+        _refresh_status_ts()
+
+
+@asynccontextmanager
+async def _browser_session():
+    """Yield a lazy browser getter and tear everything down on exit.
+
+    Chromium is only launched on the first poll that actually needs it
+    (HTTP path failed or ``FORCE_PLAYWRIGHT`` set); once up, it stays
+    alive for the rest of the session.
+    """
+    p = None
+    browser = None
+
+    async def get_browser():
+        nonlocal p, browser
+        if browser is None:
+            async_playwright = _async_playwright()
+            p = await async_playwright().start()
+            # PLAYWRIGHT_CHANNEL=chrome reuses a system Chrome (set in
+            # CI, where the runner image ships one); unset, the bundled
+            # Chromium build is used as before.
+            browser = await p.chromium.launch(
+                headless=True, channel=os.getenv("PLAYWRIGHT_CHANNEL") or None
+            )
+        return browser
 
+    try:
+        yield get_browser
+    finally:
+        if browser is not None:
+            await browser.close()
+        if p is not None:
+            await p.stop()
+        if _http_client is not None:
+            await _http_client.aclose()
 
-class _HelperTests(unittest.TestCase):
-    def setUp(self):
-        self.tmp = Path("_tmp.txt")
-        self.tmp.unlink(missing_ok=True)
 
-    def tearDown(self):
-        self.tmp.unlink(missing_ok=True)
+async def _run_once() -> None:
+    async with _browser_session() as get_browser:
+        await _check_once(get_browser)
 
-    def test_read_write(self):
-        self.assertEqual(read_last_status(self.tmp), "")
-        write_last_status("Pending", self.tmp)
-        self.assertEqual(read_last_status(self.tmp), "Pending")
 
-    def test_compose_email(self):
-        self.assertIn("Offer", _compose_email("Offer").get_content())
+async def _run_forever() -> None:
+    """In-process scheduler for hosts without cron/systemd/Actions."""
+    async with _browser_session() as get_browser:
+        while True:
+            await _check_once(get_browser)
+            await asyncio.sleep(POLL_INTERVAL_S)
 
 
 def _main() -> None:
-    if len(sys.argv) > 1 and sys.argv[1] == "test":
-        unittest.main(argv=[sys.argv[0]])
+    if len(sys.argv) > 1 and sys.argv[1] == "loop":
+        asyncio.run(_run_forever())
     else:
-        asyncio.run(_check_once())
+        asyncio.run(_run_once())
 
 if __name__ == "__main__":
     _main()
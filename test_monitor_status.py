@@ -0,0 +1,39 @@
+# test_monitor_status.py
+"""Helper tests for ``monitor_status``, kept out of the production module
+so a poll never imports unittest. Run with ``pytest`` or
+``python -m unittest test_monitor_status``."""
+import os
+import unittest
+from pathlib import Path
+
+for _key, _value in {
+    "EMIRATES_USER": "user@example.com",
+    "EMIRATES_PASS": "secret",
+    "EMAIL_FROM": "from@example.com",
+    "EMAIL_TO": "to@example.com",
+    "EMAIL_PASSWORD": "app-password",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+from monitor_status import _compose_email, read_last_status, write_last_status
+
+
+class HelperTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path("_tmp.txt")
+        self.tmp.unlink(missing_ok=True)
+
+    def tearDown(self):
+        self.tmp.unlink(missing_ok=True)
+
+    def test_read_write(self):
+        self.assertEqual(read_last_status(self.tmp), "")
+        write_last_status("Pending", self.tmp)
+        self.assertEqual(read_last_status(self.tmp), "Pending")
+
+    def test_compose_email(self):
+        self.assertIn("Offer", _compose_email("Offer").get_content())
+
+
+if __name__ == "__main__":
+    unittest.main()